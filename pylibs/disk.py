@@ -1,12 +1,161 @@
 #soho_core_api/pylibs/disk.py
+import errno
 import os
 import re
-import glob
 import subprocess
-from typing import Dict, Any, Optional, List, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Tuple, Callable, Set
 
 from pylibs import run_cli_command
-from pylibs.file import FileManager
+
+# الگوهای کامپایل‌شده یک‌باره در سطح ماژول (به جای کامپایل/جستجو در کش re در هر فراخوانی)
+_DISK_RE = re.compile(r'^(?:sd[a-z]+|nvme[0-9]+n[0-9]+|vd[a-z]+|hd[a-z]+)$')
+_match_disk_name = _DISK_RE.match
+
+# الگوی مقدار خام عددی در ستون RAW_VALUE خروجی smartctl (مثل '35 (Min/Max 20/45)')
+_SMART_ID_RE = re.compile(r"^(\d+)")
+
+# شناسه‌های ویژگی SMART مربوط به دما (190: Airflow_Temperature، 194: Temperature_Celsius)
+_SMART_TEMP_PREFIXES: Tuple[str, ...] = ("190 ", "190\t", "194 ", "194\t")
+
+
+# پرچم‌های باز کردن فایل‌های کوچک sysfs؛ O_NOATIME برای فایل‌هایی که مالکشان نیستیم EPERM می‌دهد
+# و در آن صورت یک بار برای همیشه کنار گذاشته می‌شود
+_O_NOATIME: int = getattr(os, "O_NOATIME", 0)
+_read_flags: int = os.O_RDONLY | os.O_CLOEXEC | _O_NOATIME
+
+
+def _read_raw(path: str, size: int = 4096) -> bytes:
+    """خواندن بایت‌های خام یک فایل کوچک با os.open/os.read بدون لایه I/O بافردار پایتون.
+
+    Args:
+        path (str): مسیر فایل.
+        size (int): حداکثر تعداد بایت خوانده‌شده.
+
+    Returns:
+        bytes: محتوای فایل یا بایت خالی در صورت خطا.
+    """
+    global _read_flags
+    try:
+        try:
+            fd = os.open(path, _read_flags)
+        except PermissionError as e:
+            if e.errno != errno.EPERM or not _read_flags & _O_NOATIME:
+                raise
+            _read_flags &= ~_O_NOATIME
+            fd = os.open(path, _read_flags)
+        try:
+            return os.read(fd, size)
+        finally:
+            os.close(fd)
+    except (OSError, IOError):
+        return b""
+
+
+def _read_small(path: str) -> str:
+    """خواندن و إستریپ یک فایل متنی کوچک sysfs.
+
+    Args:
+        path (str): مسیر فایل.
+
+    Returns:
+        str: محتوای فایل یا رشته خالی در صورت خطا.
+    """
+    return _read_raw(path).strip().decode("utf-8", "replace")
+
+
+def _read_small_int(path: str) -> Optional[int]:
+    """خواندن یک فایل عددی sysfs (مثل temp1_input) و تبدیل مستقیم بایت‌ها به int بدون decode.
+
+    Args:
+        path (str): مسیر فایل.
+
+    Returns:
+        Optional[int]: مقدار عددی یا None اگر فایل خوانده نشود یا عدد نباشد.
+    """
+    try:
+        return int(_read_raw(path))
+    except ValueError:
+        return None
+
+
+class _PassCache:
+    """کش موقت یک دور جمع‌آوری اطلاعات دیسک (get_disk_info / get_disks_info_all).
+
+    لینک‌های /dev/disk/by-id و by-uuid فقط یک بار در هر دور خوانده می‌شوند و با پایان دور
+    دور ریخته می‌شوند تا بین درخواست‌ها کهنه نمانند. هر دور کش خودش را دارد و صراحتاً به
+    متدهای داخلی پاس داده می‌شود (نه روی نمونه DiskManager)، تا دورهای هم‌زمان چند thread
+    روی یک نمونه مشترک با هم تداخل نداشته باشند.
+    """
+
+    __slots__ = ("_manager", "_by_id_by_name", "_uuid_by_name", "_mounts")
+
+    def __init__(self, manager: "DiskManager", mounts: Optional["_MountTable"] = None) -> None:
+        self._manager = manager
+        self._by_id_by_name: Optional[Dict[str, str]] = None
+        self._uuid_by_name: Optional[Dict[str, str]] = None
+        self._mounts = mounts
+
+    @property
+    def mounts(self) -> "_MountTable":
+        """جدول mountهای این دور؛ در اولین نیاز یک بار از نو خوانده می‌شود و در طول دور ثابت می‌ماند."""
+        if self._mounts is None:
+            self._mounts = self._manager._reload_mounts()
+        return self._mounts
+
+    @property
+    def by_id_by_name(self) -> Dict[str, str]:
+        """نگاشت نام دستگاه به بهترین نام by-id آن (wwn-* مقدم بر nvme-*)."""
+        if self._by_id_by_name is None:
+            self._by_id_by_name = self._manager._build_by_id_index()
+        return self._by_id_by_name
+
+    @property
+    def uuid_by_name(self) -> Dict[str, str]:
+        """نگاشت نام دستگاه به اولین UUID آن (به ترتیب نام) در /dev/disk/by-uuid."""
+        if self._uuid_by_name is None:
+            self._uuid_by_name = self._manager._build_uuid_index()
+        return self._uuid_by_name
+
+
+class _MountTable:
+    """جدول mountهای دستگاه‌های /dev که یک بار از /proc/mounts ساخته می‌شود.
+
+    Attributes:
+        by_dev: نگاشت مسیر دستگاه (مثل '/dev/sda1') به اطلاعات اولین mount آن.
+        points_by_disk: نگاشت نام دیسک به نقاط mount پارتیشن‌هایش (به ترتیب /proc/mounts).
+        unique_points_by_disk: مانند points_by_disk ولی فقط اولین نقطه mount هر پارتیشن؛
+            mountهای bind و subvolumeهای همان دستگاه یک فایل‌سیستم هستند و دوباره شمرده نمی‌شوند.
+        root_devs: نام دستگاه‌هایی که روی '/' mount شده‌اند.
+    """
+
+    __slots__ = ("by_dev", "points_by_disk", "unique_points_by_disk", "root_devs")
+
+    def __init__(self) -> None:
+        self.by_dev: Dict[str, Dict[str, Any]] = {}
+        self.points_by_disk: Dict[str, List[str]] = {}
+        self.unique_points_by_disk: Dict[str, List[str]] = {}
+        self.root_devs: List[str] = []
+
+
+@dataclass(frozen=True)
+class _DiskCtx:
+    """زمینه یک‌باره محاسبه‌شده هر دیسک در یک دور get_disk_info.
+
+    پارتیشن‌ها، نقاط mount آن‌ها و UUID یک بار از کش‌های دور استخراج می‌شوند و
+    بقیه بخش‌های get_disk_info به جای پیمایش دوباره از همین استفاده می‌کنند.
+    """
+
+    # در هر دور برای هر دیسک یک نمونه ساخته می‌شود؛ __slots__ جای __dict__ هر نمونه را می‌گیرد
+    __slots__ = ("disk", "partitions", "mount_points", "uuid")
+
+    disk: str
+    partitions: Tuple[str, ...]
+    mount_points: Tuple[str, ...]
+    uuid: Optional[str]
 
 
 class DiskManager:
@@ -21,17 +170,220 @@ class DiskManager:
     PROC_MOUNTS: str = "/proc/mounts"
     SYS_CLASS_HWMON: str = "/sys/class/hwmon"
     SYS_SCSI_DISK: str = "/sys/class/scsi_disk"
+    SMARTCTL_PATH: str = "/usr/sbin/smartctl"
 
     # الگوی دستگاه‌های بلاکی معتبر
-    VALID_DISK_PATTERN: str = r'^(sd[a-z]+|nvme[0-9]+n[0-9]+|vd[a-z]+|hd[a-z]+)$'
+    VALID_DISK_PATTERN: str = _DISK_RE.pattern
 
     # پیشوندهای دستگاه‌های مجازی برای فیلتر کردن
     EXCLUDED_PREFIXES: Tuple[str, ...] = ('loop', 'ram', 'sr', 'fd', 'md', 'dm-', 'zram')
 
-    def __init__(self,contain_os_disk: bool = False) -> None:
-        """سازنده کلاس — محاسبه دیسک سیستم‌عامل و لیست تمام دیسک‌ها."""
-        self.os_disk: Optional[str] = self.get_os_disk()
-        self.disks: List[str] = self._get_all_disk_names(contain_os_disk=contain_os_disk)
+    # حداکثر تعداد thread برای جمع‌آوری هم‌زمان اطلاعات دیسک‌ها در get_disks_info_all
+    MAX_INFO_WORKERS: int = 8
+
+    # ویژگی‌های ثابت sysfs هر دیسک: (زیرپوشه /sys/block/{disk}، نام فایل‌ها)؛ نام فایل همان کلید خروجی است
+    _STATIC_ATTRS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+        ("device", ("model", "vendor", "wwid")),
+        ("queue", ("physical_block_size", "logical_block_size")),
+    )
+
+    # اندازه بافر خواندن /proc/mounts (برای اکثر سیستم‌ها کل جدول در یک read جا می‌شود)
+    _MOUNTS_READ_SIZE: int = 1 << 16
+
+    # مدت (ثانیه) نگهداری نتیجه منفی جستجوی حسگر hwmon یک دیسک
+    HWMON_NEGATIVE_TTL: float = 60.0
+
+    # مدت (ثانیه) نگهداری دمای خوانده‌شده با smartctl (مثبت یا منفی) تا هر بار پردازه جدید اجرا نشود
+    SMARTCTL_TTL: float = 30.0
+
+    # حداکثر عمر (ثانیه) توپولوژی نمونه مشترک؛ پس از آن instance() نمونه تازه‌ای جایگزین می‌کند
+    TOPOLOGY_TTL: float = 60.0
+
+    # نمونه‌های مشترک به تفکیک مقدار contain_os_disk (برای instance())
+    _instances: Dict[bool, "DiskManager"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self,contain_os_disk: bool = False, temp_ttl_s: float = 15.0, usage_ttl_s: float = 0.0) -> None:
+        """سازنده کلاس — محاسبه دیسک سیستم‌عامل و لیست تمام دیسک‌ها.
+
+        Args:
+            contain_os_disk (bool): آیا دیسک سیستم‌عامل هم در لیست دیسک‌ها باشد؟
+            temp_ttl_s (float): مدت (ثانیه) استفاده دوباره از دمای خوانده‌شده هر دیسک؛ صفر یعنی بدون کش.
+            usage_ttl_s (float): مدت (ثانیه) استفاده دوباره از آمار فضای مصرفی هر دیسک؛ صفر (پیش‌فرض)
+                یعنی هر بار statvfs اجرا شود.
+        """
+        self._contain_os_disk: bool = contain_os_disk
+        self._temp_ttl_s: float = temp_ttl_s
+        self._usage_ttl_s: float = usage_ttl_s
+        # اگر فرآیند خودش root باشد، اجرای sudo برای هر دستور فقط یک fork/exec اضافه است
+        self._use_sudo: bool = os.geteuid() != 0
+        self._sys_block_entries: List[str] = []
+        self._sys_block_names: Set[str] = set()
+        self._refreshed_at: float = 0.0
+        self._partitions_by_disk: Dict[str, List[str]] = {}
+        # ویژگی‌های ثابت هر دیسک/پارتیشن (مدل، vendor، wwn، نوع و ...) با کلید (نام ویژگی، نام دستگاه)
+        self._static_cache: Dict[Tuple[str, str], Any] = {}
+        self._hwmon_temp_paths: Optional[Dict[str, List[str]]] = None
+        self._hwmon_scanned_at: float = 0.0
+        # مسیرهای دمای hwmon هر دیسک: (مسیرها، زمان انقضا)؛ انقضا فقط برای نتیجه منفی معنا دارد
+        self._hwmon_by_disk: Dict[str, Tuple[Tuple[str, ...], float]] = {}
+        # منبع sysfs که آخرین بار دمای هر دیسک را برگرداند (hwmon/device/scsi)
+        self._temp_source: Dict[str, Callable[[str], Optional[int]]] = {}
+        # کش‌های زمان‌دار: مقدار و زمان انقضا (time.monotonic) برای دمای smartctl، دمای نهایی و فضای مصرفی
+        self._smart_temps: Dict[str, Tuple[Optional[int], float]] = {}
+        self._temp_cache: Dict[str, Tuple[Optional[int], float]] = {}
+        # وجود فایل اجرایی smartctl؛ None یعنی هنوز بررسی نشده
+        self._smartctl_ok: Optional[bool] = None
+        self._usage_cache: Dict[Tuple[str, bool], Tuple[Dict[str, Optional[float]], float]] = {}
+        self._mounts: Optional[_MountTable] = None
+        # دیسک سیستم‌عامل و لیست دیسک‌ها در اولین دسترسی محاسبه می‌شوند (ویژگی‌های os_disk و disks)
+        self._os_disk: Optional[str] = None
+        self._os_disk_known: bool = False
+        self._disks: Optional[List[str]] = None
+        self.refresh()
+
+    @classmethod
+    def instance(cls, contain_os_disk: bool = False) -> "DiskManager":
+        """دریافت نمونه مشترک (singleton) کلاس تا کار سازنده در هر درخواست تکرار نشود.
+
+        نمونه مشترک لیست دیسک‌ها را یک بار می‌سازد و اگر قدیمی‌تر از TOPOLOGY_TTL ثانیه باشد،
+        یک نمونه تازه ساخته و جایگزین آن می‌شود؛ بنابراین اتصال/جداسازی دیسک (hotplug) حداکثر
+        پس از این مدت دیده می‌شود. نمونه مشترک هم‌زمان در چند thread خوانده می‌شود، پس نباید روی
+        آن refresh() صدا زد؛ برای دیدن فوری تغییر توپولوژی یک نمونه خصوصی با DiskManager()
+        بسازید. تغییر پارتیشن‌های یک دیسک از بیرون این کلاس با invalidate_shared() اعلام می‌شود.
+
+        Args:
+            contain_os_disk (bool): آیا دیسک سیستم‌عامل هم در لیست دیسک‌ها باشد؟
+
+        Returns:
+            DiskManager: نمونه مشترک متناظر با contain_os_disk.
+        """
+        with cls._instances_lock:
+            manager = cls._instances.get(contain_os_disk)
+            if manager is None or time.monotonic() - manager._refreshed_at >= cls.TOPOLOGY_TTL:
+                # نمونه تازه ساخته و یکجا جایگزین می‌شود؛ threadهایی که نمونه قبلی را گرفته‌اند
+                # دورشان را روی همان نمای سازگار قبلی تمام می‌کنند
+                manager = cls(contain_os_disk=contain_os_disk)
+                cls._instances[contain_os_disk] = manager
+            return manager
+
+    def refresh(self) -> None:
+        """بازخوانی توپولوژی دیسک‌ها (مثلاً پس از hotplug) در نمونه‌ای که مالک آن هستید.
+
+        لیست /sys/block یک بار خوانده می‌شود و تمام کش‌های هر دیسک (و جدول mountها) خالی
+        می‌شوند. دیسک سیستم‌عامل و لیست دیسک‌ها در اولین دسترسی بعدی از روی همان لیست محاسبه می‌شوند.
+        بازخوانی درجا با خواندن هم‌زمان threadهای دیگر امن نیست؛ فقط روی نمونه‌های خصوصی
+        (DiskManager()) صدا زده شود، نه روی نمونه مشترک instance() که پس از TOPOLOGY_TTL
+        خودش با نمونه تازه جایگزین می‌شود.
+        """
+        self._sys_block_entries = self._list_sys_block()
+        self._refreshed_at = time.monotonic()
+        self._sys_block_names = set(self._sys_block_entries)
+        self.invalidate_cache()
+        self._os_disk = None
+        self._os_disk_known = False
+        self._disks = None
+
+    @classmethod
+    def invalidate_shared(cls, disk: str) -> None:
+        """باطل کردن کش یک دیسک در تمام نمونه‌های مشترک (مثلاً پس از ساخت pool روی آن).
+
+        فقط کش همان دیسک و پارتیشن‌هایش پاک می‌شود، که برخلاف refresh() در کنار خواندن
+        هم‌زمان threadهای دیگر امن است.
+
+        Args:
+            disk (str): نام دیسک (مثل 'sda').
+        """
+        with cls._instances_lock:
+            managers = list(cls._instances.values())
+        for manager in managers:
+            manager.invalidate_cache(disk)
+
+    @property
+    def os_disk(self) -> Optional[str]:
+        """نام دیسک سیستم‌عامل (مثل 'sda')؛ در اولین دسترسی از روی جدول mountها محاسبه می‌شود."""
+        if not self._os_disk_known:
+            self._os_disk = self.get_os_disk()
+            self._os_disk_known = True
+        return self._os_disk
+
+    @property
+    def disks(self) -> List[str]:
+        """لیست دیسک‌های فیزیکی (با یا بدون دیسک سیستم‌عامل بسته به contain_os_disk)؛ محاسبه در اولین دسترسی."""
+        if self._disks is None:
+            self._disks = self._get_all_disk_names(contain_os_disk=self._contain_os_disk)
+        return self._disks
+
+    def invalidate_cache(self, disk: Optional[str] = None) -> None:
+        """خالی کردن کش ویژگی‌های ثابت و لیست پارتیشن‌ها (مثلاً پس از hotplug یا پارتیشن‌بندی).
+
+        Args:
+            disk (Optional[str]): نام دیسک؛ فقط کش این دیسک و پارتیشن‌هایش پاک می‌شود.
+                اگر None باشد کل کش پاک می‌شود.
+        """
+        if disk is None:
+            self._partitions_by_disk = {}
+            self._static_cache = {}
+            self._hwmon_temp_paths = None
+            self._hwmon_by_disk = {}
+            self._temp_source = {}
+            self._smart_temps = {}
+            self._temp_cache = {}
+            self._smartctl_ok = None
+            self._usage_cache = {}
+            self._mounts = None
+            return
+        self._partitions_by_disk.pop(disk, None)
+        self._hwmon_by_disk.pop(disk, None)
+        self._temp_source.pop(disk, None)
+        self._smart_temps.pop(disk, None)
+        self._temp_cache.pop(disk, None)
+        self._usage_cache.pop((disk, True), None)
+        self._usage_cache.pop((disk, False), None)
+        # list() کلیدها را یکجا (زیر GIL) برمی‌دارد؛ threadهای get_disks_info_all ممکن است هم‌زمان کش را پر کنند
+        for key in [k for k in list(self._static_cache) if k[1] == disk or self._is_partition_of(k[1], disk)]:
+            self._static_cache.pop(key, None)
+
+    def _cached(self, attr: str, name: str, loader: Callable[[str], Any]) -> Any:
+        """برگرداندن ویژگی ثابت یک دستگاه از کش یا محاسبه یک‌باره آن با loader.
+
+        Args:
+            attr (str): نام ویژگی (مثل 'model').
+            name (str): نام دیسک یا پارتیشن.
+            loader (Callable[[str], Any]): تابع محاسبه مقدار از روی نام دستگاه.
+
+        Returns:
+            Any: مقدار ویژگی.
+        """
+        key = (attr, name)
+        try:
+            return self._static_cache[key]
+        except KeyError:
+            value = self._static_cache[key] = loader(name)
+            return value
+
+    @staticmethod
+    def _ttl_cached(store: Dict[Any, Tuple[Any, float]], key: Any, ttl: float, loader: Callable[[], Any]) -> Any:
+        """برگرداندن مقدار کش‌شده تا پیش از انقضای TTL، یا محاسبه و ذخیره دوباره آن.
+
+        Args:
+            store (Dict[Any, Tuple[Any, float]]): دیکشنری کش با مقدار (مقدار، زمان انقضا).
+            key (Any): کلید کش.
+            ttl (float): مدت اعتبار به ثانیه؛ صفر یا منفی یعنی بدون کش.
+            loader (Callable[[], Any]): تابع محاسبه مقدار.
+
+        Returns:
+            Any: مقدار (ممکن است None هم کش شود).
+        """
+        if ttl <= 0:
+            return loader()
+        now = time.monotonic()
+        hit = store.get(key)
+        if hit is not None and now < hit[1]:
+            return hit[0]
+        value = loader()
+        store[key] = (value, now + ttl)
+        return value
 
     def _is_valid_device_name(self, device_name: str) -> bool:
         """بررسی اعتبار نام دستگاه بلاکی.
@@ -42,7 +394,7 @@ class DiskManager:
         Returns:
             bool: مقدار «ترو» اگر نام معتبر باشد.
         """
-        return bool(re.match(self.VALID_DISK_PATTERN, device_name))
+        return _match_disk_name(device_name) is not None
 
     def _is_block_device(self, device_name: str) -> bool:
         """بررسی اینکه آیا نام داده‌شده مربوط به یک بلاک دیوایس است.
@@ -53,7 +405,7 @@ class DiskManager:
         Returns:
             bool: مقدار «ترو» اگر بلاک دیوایس باشد.
         """
-        return os.path.exists(f"{self.SYS_BLOCK}/{device_name}")
+        return self._fast_exists(f"{self.SYS_BLOCK}/{device_name}")
 
     def _get_all_disk_names(self, contain_os_disk: bool = True) -> List[str]:
         """بازیابی لیست تمام دیسک‌های فیزیکی سیستم با فیلتر کردن دستگاه‌های مجازی.
@@ -67,21 +419,132 @@ class DiskManager:
         Raises:
             RuntimeError: اگر سیستم‌عامل لینوکس نباشد.
         """
-        if not os.path.exists(self.SYS_BLOCK):
-            raise RuntimeError("/sys/block not found – OS is not Linux?")
-
         found_disks: List[str] = []
+        for name in self._sys_block_entries:
+            # الگوی مجاز خودش loop/ram/sr/... را رد می‌کند؛ پس یک match برای اکثر ورودی‌ها کافی است
+            # و فیلتر پیشوندها (با tuple در C) فقط برای نام‌های منطبق اجرا می‌شود
+            if not _match_disk_name(name) or name.startswith(self.EXCLUDED_PREFIXES):
+                continue
+            if not contain_os_disk and name == self.os_disk:
+                continue
+            found_disks.append(name)
+        return sorted(found_disks)
+
+    def _list_sys_block(self) -> List[str]:
+        """خواندن یک‌باره نام تمام ورودی‌های /sys/block.
+
+        Returns:
+            List[str]: نام ورودی‌ها (شامل دستگاه‌های مجازی).
+
+        Raises:
+            RuntimeError: اگر /sys/block وجود نداشته باشد (سیستم‌عامل لینوکس نیست).
+        """
         try:
-            for entry in os.listdir(self.SYS_BLOCK):
-                if any(entry.startswith(prefix) for prefix in self.EXCLUDED_PREFIXES):
-                    continue
-                if self._is_valid_device_name(entry):
-                    if not contain_os_disk and entry == self.os_disk:
+            with os.scandir(self.SYS_BLOCK) as it:
+                return [entry.name for entry in it]
+        except FileNotFoundError:
+            raise RuntimeError("/sys/block not found – OS is not Linux?") from None
+        except (OSError, IOError):
+            return []
+
+    @staticmethod
+    def _is_partition_of(dev_name: str, disk: str) -> bool:
+        """بررسی اینکه آیا نام دستگاه، یک پارتیشن از دیسک داده‌شده است (بدون regex).
+
+        مثال:
+            ('sda1', 'sda') → True
+            ('nvme0n1p2', 'nvme0n1') → True
+            ('sdaa1', 'sda') → False
+
+        Args:
+            dev_name (str): نام دستگاه بدون مسیر (مثل 'sda1').
+            disk (str): نام دیسک (مثل 'sda', 'nvme0n1', 'mmcblk0').
+
+        Returns:
+            bool: مقدار «ترو» اگر dev_name پارتیشنی از disk باشد.
+        """
+        prefix = DiskManager._partition_prefix(disk)
+        return dev_name.startswith(prefix) and dev_name[len(prefix):].isdigit()
+
+    @staticmethod
+    def _partition_prefix(disk: str) -> str:
+        """پیشوند نام پارتیشن‌های یک دیسک (nvme0n1 → nvme0n1p، mmcblk0 → mmcblk0p، sda → sda)."""
+        return disk + "p" if disk.startswith(("nvme", "mmcblk")) else disk
+
+    @staticmethod
+    def _sys_realpath(link_path: str) -> str:
+        """تبدیل یک symlink در sysfs (یا لینک‌های udev در /dev/disk) به مسیر واقعی با تنها یک readlink.
+
+        این لینک‌ها مستقیماً به مسیر واقعی اشاره می‌کنند (زنجیره لینک ندارند)، بنابراین
+        به شرط واقعی بودن دایرکتوری والد، normpath روی هدف لینک همان نتیجه realpath را می‌دهد.
+        اگر مسیر symlink نباشد یا خوانده نشود، به os.path.realpath برمی‌گردد.
+
+        Args:
+            link_path (str): مسیر لینک (مثل '/sys/block/sda').
+
+        Returns:
+            str: مسیر واقعی.
+        """
+        try:
+            target = os.readlink(link_path)
+        except OSError:
+            return os.path.realpath(link_path)
+        if target.startswith("/"):
+            return os.path.normpath(target)
+        # هدف لینک‌های sysfs نسبی است؛ چسباندن رشته‌ای جایگزین os.path.join/dirname
+        return os.path.normpath(f"{link_path.rpartition('/')[0]}/{target}")
+
+    @staticmethod
+    def _fast_exists(path: str) -> bool:
+        """بررسی وجود مسیر با یک فراخوانی access(F_OK).
+
+        برخلاف os.path.exists که stat کامل انجام داده و ساختار آن را کپی می‌کند، access فقط
+        پیمایش مسیر را انجام می‌دهد. مانند exists، لینک‌ها دنبال می‌شوند.
+
+        Args:
+            path (str): مسیر فایل یا دایرکتوری.
+
+        Returns:
+            bool: مقدار «ترو» اگر مسیر وجود داشته باشد.
+        """
+        try:
+            return os.access(path, os.F_OK)
+        except (OSError, ValueError):
+            return False
+
+    def _disk_device_path(self, disk: str) -> str:
+        """مسیر واقعی /sys/block/{disk}/device با دو readlink به جای پیمایش کامل realpath.
+
+        خود /sys/block/{disk} یک لینک است، پس ابتدا آن (از کش get_path) و سپس لینک device
+        نسبت به آن حل می‌شود.
+        """
+        return self._sys_realpath(f"{self.get_path(disk)}/device")
+
+    @staticmethod
+    def _bulk_read(dir_path: str, names: Tuple[str, ...]) -> Dict[str, str]:
+        """خواندن چند فایل کوچک از یک دایرکتوری sysfs با یک پیمایش scandir.
+
+        فقط فایل‌هایی که واقعاً در دایرکتوری هستند باز می‌شوند؛ برای نام‌های موجودنبودن
+        (مثلاً vendor در NVMe) هیچ open ناموفقی انجام نمی‌شود.
+
+        Args:
+            dir_path (str): مسیر دایرکتوری (مثل '/sys/block/sda/queue').
+            names (Tuple[str, ...]): نام فایل‌های موردنیاز.
+
+        Returns:
+            Dict[str, str]: نگاشت نام فایل به محتوای strip‌شده؛ برای فایل‌های ناموجود یا
+            غیرقابل‌خواندن رشته خالی.
+        """
+        result = dict.fromkeys(names, "")
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    if entry.name not in result:
                         continue
-                    found_disks.append(entry)
+                    result[entry.name] = _read_small(entry.path)
         except (OSError, IOError):
             pass
-        return sorted(found_disks)
+        return result
 
     def has_os_on_disk(self, disk: str) -> bool:
         """بررسی اینکه آیا سیستم‌عامل روی دیسک داده‌شده نصب شده است.
@@ -105,14 +568,39 @@ class DiskManager:
         Returns:
             bool: مقدار «ترو» اگر پارتیشن داشته باشد.
         """
-        sys_path = f"{self.SYS_BLOCK}/{disk}"
+        return bool(self._scan_partitions(disk))
+
+    def _scan_partitions(self, disk: str) -> List[str]:
+        """پیمایش /sys/block/{disk} و جمع‌آوری نام پارتیشن‌ها به ترتیب طبیعی (sda1 قبل از sda10).
+
+        همه نام‌ها «پیشوند دیسک + عدد» هستند، پس مرتب‌سازی فقط با عدد انتهایی و بدون regex
+        انجام می‌شود. نتیجه برای هر دیسک کش می‌شود و با refresh() یا پاک‌کردن سیگنچرهای دیسک باطل می‌شود.
+
+        Args:
+            disk (str): نام دیسک.
+
+        Returns:
+            List[str]: کپی لیست نام پارتیشن‌ها یا لیست خالی در صورت خطا.
+        """
+        cached = self._partitions_by_disk.get(disk)
+        if cached is not None:
+            return list(cached)
+
+        prefix = self._partition_prefix(disk)
+        prefix_len = len(prefix)
+        numbered: List[Tuple[int, str]] = []
         try:
-            for entry in os.listdir(sys_path):
-                if entry.startswith(disk) and entry != disk:
-                    return True
+            with os.scandir(f"{self.SYS_BLOCK}/{disk}") as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith(prefix) and name[prefix_len:].isdigit():
+                        numbered.append((int(name[prefix_len:]), name))
         except (OSError, IOError):
             pass
-        return False
+        numbered.sort()
+        partitions = [name for _, name in numbered]
+        self._partitions_by_disk[disk] = partitions
+        return list(partitions)
 
     def get_disk_name_from_partition_name(self, partition_name: str) -> Optional[str]:
         """استخراج نام دیسک اصلی از نام پارتیشن.
@@ -128,21 +616,21 @@ class DiskManager:
         Returns:
             Optional[str]: نام دیسک اصلی یا None اگر نام معتبر نباشد.
         """
-        # بررسی NVMe
-        nvme_match = re.match(r'^(nvme\d+n\d+)p\d+$', partition_name)
-        if nvme_match:
-            return nvme_match.group(1)
-
-        # بررسی MMC
-        mmc_match = re.match(r'^(mmcblk\d+)p\d+$', partition_name)
-        if mmc_match:
-            return mmc_match.group(1)
-
-        # بررسی SATA/SCSI
-        if re.match(r'^[a-z]+\d+$', partition_name):
-            base_candidate = re.sub(r'\d+$', '', partition_name)
-            if base_candidate and self._is_block_device(base_candidate):
-                return base_candidate
+        # بررسی NVMe و MMC: '{disk}p{N}' (فقط عملیات رشته‌ای، بدون regex)
+        head, sep, tail = partition_name.rpartition("p")
+        if sep and tail.isdigit():
+            if head.startswith("nvme"):
+                controller, n_sep, namespace = head[4:].partition("n")
+                if n_sep and controller.isdigit() and namespace.isdigit():
+                    return head
+            elif head.startswith("mmcblk") and head[6:].isdigit():
+                return head
+
+        # بررسی SATA/SCSI: حروف کوچک و سپس شماره پارتیشن
+        base_candidate = partition_name.rstrip("0123456789")
+        if (base_candidate != partition_name and base_candidate.isascii() and base_candidate.isalpha()
+                and base_candidate.islower() and self._is_block_device(base_candidate)):
+            return base_candidate
 
         return None
 
@@ -163,30 +651,46 @@ class DiskManager:
                 - 'usb'
                 - 'unknown'
         """
+        return self._cached("type", disk, self._detect_disk_type)
+
+    def _detect_disk_type(self, disk: str) -> str:
+        """بدنه get_disk_type؛ نتیجه توسط _cached برای هر دیسک نگه داشته می‌شود."""
+        # مسیر سریع: نوع این دیسک‌ها فقط از روی نام مشخص است و نیازی به realpath ندارد
+        if disk.startswith("nvme"):
+            return "nvme"
+        if disk.startswith("vd"):
+            return "virtio"
+        if disk.startswith("mmcblk"):
+            return "mmc"
+        if disk.startswith("hd"):
+            return "ide"
+
+        # دیسک‌های sd*/sr* ممکن است SATA، SCSI یا USB باشند؛ تشخیص از روی مسیر دستگاه
+        # EAFP: خود readlink نبودن دیسک را گزارش می‌کند و stat جداگانه لازم نیست
+        block_link = f"{self.SYS_BLOCK}/{disk}"
         try:
-            sys_block_path = f"{self.SYS_BLOCK}/{disk}"
-            if not os.path.exists(sys_block_path):
-                return "unknown"
-
-            device_path = os.path.realpath(os.path.join(sys_block_path, "device"))
-            device_path_str = device_path.lower()
-
-            if "nvme" in device_path_str or disk.startswith("nvme"):
-                return "nvme"
-            if "virtio" in device_path_str or disk.startswith("vd"):
-                return "virtio"
-            if "mmc" in device_path_str or disk.startswith("mmcblk"):
-                return "mmc"
-            if "usb" in device_path_str:
-                return "usb"
-            if "ide" in device_path_str or disk.startswith("hd"):
-                return "ide"
-            if "scsi" in device_path_str or any(disk.startswith(prefix) for prefix in ("sd", "sr")):
-                # تمایز SATA از SCSI بر اساس وجود 'ata' در مسیر
-                return "sata" if "ata" in device_path_str else "scsi"
-            return "unknown"
-        except (OSError, IOError, ValueError):
+            block_path = os.path.normpath(f"{self.SYS_BLOCK}/{os.readlink(block_link)}")
+        except FileNotFoundError:
             return "unknown"
+        except OSError:
+            # ورودی symlink نیست (کرنل‌های قدیمی)؛ حل کامل مسیر
+            block_path = os.path.realpath(block_link)
+        device_path_str = self._sys_realpath(f"{block_path}/device").lower()
+
+        if "nvme" in device_path_str:
+            return "nvme"
+        if "virtio" in device_path_str:
+            return "virtio"
+        if "mmc" in device_path_str:
+            return "mmc"
+        if "usb" in device_path_str:
+            return "usb"
+        if "ide" in device_path_str:
+            return "ide"
+        if "scsi" in device_path_str or disk.startswith(("sd", "sr")):
+            # تمایز SATA از SCSI بر اساس وجود 'ata' در مسیر
+            return "sata" if "ata" in device_path_str else "scsi"
+        return "unknown"
 
     def get_slot_number(self, disk: str) -> Optional[str]:
         """دریافت شماره اسلات (slot) دیسک از فایل‌های سیستمی.
@@ -202,47 +706,66 @@ class DiskManager:
         Returns:
             Optional[str]: شماره اسلات (مثل '3') یا None اگر در دسترس نباشد.
         """
-        # روش ۱: فایل مستقیم slot
-        slot_path = f"{self.SYS_BLOCK}/{disk}/device/slot"
-        if os.path.exists(slot_path):
-            return FileManager.read_strip(slot_path)
-
-        # روش ۲: جستجو در scsi_disk برای enclosure
-        if os.path.exists(self.SYS_SCSI_DISK):
-            try:
-                for entry in os.listdir(self.SYS_SCSI_DISK):
-                    device_path = os.path.join(self.SYS_SCSI_DISK, entry, "device")
-                    block_link = os.path.join(device_path, "block")
-                    if os.path.exists(block_link):
-                        try:
-                            resolved = os.readlink(block_link)
-                            if resolved == disk:
-                                for fname in os.listdir(device_path):
-                                    if "enclosure" in fname or "slot" in fname:
-                                        slot_val = FileManager.read_strip(os.path.join(device_path, fname))
-                                        if slot_val.isdigit():
-                                            return slot_val
-                        except (OSError, ValueError):
-                            continue
-            except (OSError, IOError):
-                pass
+        return self._cached("slot_number", disk, self._find_slot_number)
 
-        # روش ۳: استخراج از مسیر device_path
+    def _find_slot_number(self, disk: str) -> Optional[str]:
+        """بدنه get_slot_number؛ نتیجه توسط _cached برای هر دیسک نگه داشته می‌شود."""
+        # روش ۱: فایل مستقیم slot
+        # EAFP: نبودن فایل همان رشته خالی _read_small است و stat جداگانه لازم نیست
+        slot_val = self._safe_read(disk, "device/slot")
+        if slot_val:
+            return slot_val
+
+        # روش ۲: فایل‌های enclosure/slot در پوشه دستگاه SCSI
+        # /sys/block/{disk}/device همان پوشه‌ای است که /sys/class/scsi_disk/*/device به آن اشاره می‌کند؛
+        # EAFP: نبودن آن (دیسک غیر SCSI) را خود scandir گزارش می‌کند
         try:
-            device_path = os.path.realpath(f"{self.SYS_BLOCK}/{disk}")
-            # جستجوی الگوی targetX:0:0
-            match = re.search(r'/target(\d+):0:0/', device_path)
-            if match:
-                return match.group(1)
-            # جستجوی الگوی X:0:0:0/block/disk
-            match2 = re.search(r'/(\d+):0:0:0/block/' + re.escape(disk) + r'$', device_path)
-            if match2:
-                return match2.group(1)
-        except (OSError, IOError, TypeError):
+            with os.scandir(f"{self.SYS_BLOCK}/{disk}/device") as dev_it:
+                for fentry in dev_it:
+                    if "enclosure" not in fentry.name and "slot" not in fentry.name:
+                        continue
+                    # d_type کش‌شده DirEntry بدون syscall اضافه پوشه/لینک‌ها (مثل
+                    # enclosure_device:*) را کنار می‌گذارد تا open بیهوده انجام نشود
+                    if not fentry.is_file(follow_symlinks=False):
+                        continue
+                    slot_val = _read_small(fentry.path)
+                    if slot_val.isdigit():
+                        return slot_val
+        except (OSError, IOError):
             pass
 
+        # روش ۳: استخراج از مسیر device_path
+        # لینک /sys/block/{disk} کل زنجیره ../devices/.../block/{disk} را در خود دارد
+        # ساختار مسیر ثابت است؛ تجزیه با split و برش رشته به جای regex
+        segments = self.get_path(disk).split("/")
+        # جستجوی قطعه targetX:0:0 (نه آخرین قطعه مسیر)
+        for seg in segments[1:-1]:
+            if seg.startswith("target") and seg.endswith(":0:0") and seg[6:-4].isdecimal():
+                return seg[6:-4]
+        # جستجوی الگوی X:0:0:0/block/disk در انتهای مسیر
+        if len(segments) >= 4 and segments[-1] == disk and segments[-2] == "block":
+            host = segments[-3]
+            if host.endswith(":0:0:0") and host[:-6].isdecimal():
+                return host[:-6]
+
         return None
 
+    def _safe_read(self, disk: str, rel: str) -> str:
+        """خواندن یک ویژگی sysfs دیسک (مثل 'device/model') بدون پرتاب خطا.
+
+        Args:
+            disk (str): نام دیسک.
+            rel (str): مسیر نسبی فایل زیر /sys/block/{disk}.
+
+        Returns:
+            str: محتوای إستریپ‌شده یا رشته خالی در صورت خطا.
+        """
+        return _read_small(f"{self.SYS_BLOCK}/{disk}/{rel}")
+
+    def _safe_read_int(self, disk: str, rel: str) -> Optional[int]:
+        """مانند _safe_read برای ویژگی‌های عددی؛ None اگر فایل خوانده نشود یا عدد نباشد."""
+        return _read_small_int(f"{self.SYS_BLOCK}/{disk}/{rel}")
+
     def get_model(self, disk: str) -> str:
         """دریافت مدل دیسک از فایل سیستمی کرنل.
 
@@ -252,7 +775,7 @@ class DiskManager:
         Returns:
             str: نام مدل دیسک یا رشته خالی در صورت عدم دسترسی.
         """
-        return FileManager.read_strip(f"{self.SYS_BLOCK}/{disk}/device/model")
+        return self._static_attrs(disk)["model"]
 
     def get_vendor(self, disk: str) -> str:
         """دریافت نام تولیدکننده (vendor) دیسک.
@@ -263,7 +786,7 @@ class DiskManager:
         Returns:
             str: نام vendor یا رشته خالی در صورت عدم دسترسی.
         """
-        return FileManager.read_strip(f"{self.SYS_BLOCK}/{disk}/device/vendor")
+        return self._static_attrs(disk)["vendor"]
 
     def get_stat(self, disk: str) -> str:
         """دریافت وضعیت فعلی دیسک (مثل 'running').
@@ -274,7 +797,7 @@ class DiskManager:
         Returns:
             str: وضعیت دیسک یا رشته خالی در صورت عدم دسترسی.
         """
-        return FileManager.read_strip(f"{self.SYS_BLOCK}/{disk}/device/state")
+        return self._safe_read(disk, "device/state")
 
     def get_physical_block_size(self, disk: str) -> str:
         """دریافت اندازه فیزیکی بلاک دیسک به بایت.
@@ -285,7 +808,7 @@ class DiskManager:
         Returns:
             str: اندازه بلاک فیزیکی (معمولاً '512' یا '4096') یا رشته خالی.
         """
-        return FileManager.read_strip(f"{self.SYS_BLOCK}/{disk}/queue/physical_block_size")
+        return self._static_attrs(disk)["physical_block_size"]
 
     def get_logical_block_size(self, disk: str) -> str:
         """دریافت اندازه منطقی بلاک دیسک به بایت.
@@ -296,7 +819,7 @@ class DiskManager:
         Returns:
             str: اندازه بلاک منطقی (معمولاً '512') یا رشته خالی.
         """
-        return FileManager.read_strip(f"{self.SYS_BLOCK}/{disk}/queue/logical_block_size")
+        return self._static_attrs(disk)["logical_block_size"]
 
     def get_scheduler(self, disk: str) -> str:
         """دریافت الگوریتم زمان‌بندی I/O دیسک.
@@ -307,7 +830,39 @@ class DiskManager:
         Returns:
             str: نام scheduler (مثل 'mq-deadline [none]') یا رشته خالی.
         """
-        return FileManager.read_strip(f"{self.SYS_BLOCK}/{disk}/queue/scheduler")
+        return self._safe_read(disk, "queue/scheduler")
+
+    def tune_readahead(self, disk: str, kb: int = 128) -> bool:
+        """تنظیم اندازه readahead دیسک از طریق /sys/block/{disk}/queue/read_ahead_kb.
+
+        این متد اختیاری است و فقط با فراخوانی صریح اجرا می‌شود؛ برای بار کاری پایش که
+        خواندن‌های کوچک انجام می‌دهد، readahead بزرگ (مثلاً ۲۰۴۸ کیلوبایت) فقط page cache را هدر می‌دهد.
+        نوشتن در sysfs نیاز به دسترسی root دارد؛ در غیر این صورت «فالس» برگردانده می‌شود.
+
+        Args:
+            disk (str): نام دیسک (مثل 'sda').
+            kb (int): اندازه readahead به کیلوبایت (پیش‌فرض ۱۲۸).
+
+        Returns:
+            bool: مقدار «ترو» در صورت موفقیت، مقدار «فالس» در غیر این صورت.
+        """
+        if not isinstance(disk, str) or not self._is_valid_device_name(disk):
+            return False
+        if not isinstance(kb, int) or isinstance(kb, bool) or kb < 0:
+            return False
+
+        try:
+            fd = os.open(f"{self.SYS_BLOCK}/{disk}/queue/read_ahead_kb", os.O_WRONLY | os.O_CLOEXEC)
+        except (OSError, IOError):
+            # PermissionError (کاربر غیر root) یا نبودن دیسک
+            return False
+        try:
+            os.write(fd, str(kb).encode())
+        except (OSError, IOError):
+            return False
+        finally:
+            os.close(fd)
+        return True
 
     def get_wwid(self, disk: str) -> str:
         """دریافت شناسه جهانی WWID دیسک (اگر در دسترس باشد).
@@ -318,7 +873,7 @@ class DiskManager:
         Returns:
             str: WWID (مثل '0x5002538d...') یا رشته خالی.
         """
-        return FileManager.read_strip(f"{self.SYS_BLOCK}/{disk}/device/wwid")
+        return self._static_attrs(disk)["wwid"]
 
     def get_path(self, disk: str) -> str:
         """دریافت مسیر واقعی (realpath) دیسک در سیستم فایل.
@@ -329,10 +884,11 @@ class DiskManager:
         Returns:
             str: مسیر واقعی یا رشته خالی در صورت خطا.
         """
-        try:
-            return os.path.realpath(f"{self.SYS_BLOCK}/{disk}")
-        except (OSError, IOError):
-            return ""
+        return self._cached("path", disk, self._resolve_path)
+
+    def _resolve_path(self, disk: str) -> str:
+        """بدنه get_path؛ نتیجه توسط _cached برای هر دیسک نگه داشته می‌شود."""
+        return self._sys_realpath(f"{self.SYS_BLOCK}/{disk}")
 
     def get_total_size(self, entry: str) -> Optional[int]:
         """دریافت حجم کل (به بایت) برای یک دیسک یا پارتیشن.
@@ -343,31 +899,19 @@ class DiskManager:
         Returns:
             Optional[int]: حجم به بایت یا None در صورت خطا.
         """
-        try:
-            base_disk = entry
-            is_partition = False
+        # EAFP: دیسک اصلی از روی لیست کش‌شده /sys/block (بدون syscall) حدس زده و مستقیماً خوانده می‌شود
+        base_disk = self._parent_block_entry(entry)
+        if base_disk is not None and base_disk != entry:
+            sectors = _read_small_int(f"{self.SYS_BLOCK}/{base_disk}/{entry}/size")
+        else:
+            sectors = _read_small_int(f"{self.SYS_BLOCK}/{entry}/size")
 
-            # تشخیص پارتیشن و استخراج دیسک اصلی
+        if sectors is None:
+            # دیسکی که پس از refresh() اضافه شده در لیست کش‌شده نیست؛ تشخیص از روی نام
             base_disk = self.get_disk_name_from_partition_name(entry)
             if base_disk is not None:
-                is_partition = True
-            else:
-                # اگر پارتیشن نبود، خود ورودی دیسک اصلی است
-                base_disk = entry
-
-            # تعیین مسیر فایل size
-            if is_partition:
-                size_path = f"{self.SYS_BLOCK}/{base_disk}/{entry}/size"
-            else:
-                size_path = f"{self.SYS_BLOCK}/{entry}/size"
-
-            if os.path.exists(size_path):
-                raw = FileManager.read_strip(size_path)
-                if raw.isdigit():
-                    return int(raw) * 512  # سکتور → بایت
-        except (OSError, IOError, ValueError):
-            pass
-        return None
+                sectors = _read_small_int(f"{self.SYS_BLOCK}/{base_disk}/{entry}/size")
+        return sectors * 512 if sectors is not None else None  # سکتور (۵۱۲ بایت) → بایت
 
     def get_uuid(self, disk: str) -> Optional[str]:
         """دریافت UUID مربوط به اولین پارتیشن معتبر روی دیسک.
@@ -380,50 +924,37 @@ class DiskManager:
         Returns:
             Optional[str]: UUID پارتیشن یا None.
         """
-        try:
-            uuid_dir = "/dev/disk/by-uuid"
-            if not os.path.exists(uuid_dir):
-                return None
+        return self._uuid_of(_PassCache(self), disk, self._scan_partitions(disk))
 
-            by_path_dir = "/dev/disk/by-path"
-            if not os.path.exists(by_path_dir):
-                return None
+    @staticmethod
+    def _uuid_of(cache: _PassCache, disk: str, partitions: List[str]) -> Optional[str]:
+        """اولین UUID (به ترتیب نام) از میان خود دیسک و پارتیشن‌هایش با استفاده از نگاشت دور."""
+        uuids = [cache.uuid_by_name[name] for name in (disk, *partitions) if name in cache.uuid_by_name]
+        return min(uuids) if uuids else None
 
-            # جمع‌آوری دستگاه‌های مرتبط با دیسک
-            related_devices = set()
-            for entry in os.listdir(by_path_dir):
-                path = os.path.join(by_path_dir, entry)
-                try:
-                    resolved = os.path.realpath(path)
-                    if resolved.startswith(f"/dev/{disk}"):
-                        related_devices.add(resolved)
-                except (OSError, IOError):
-                    continue
+    def _build_uuid_index(self) -> Dict[str, str]:
+        """ساخت نگاشت «نام دستگاه → UUID» با یک بار پیمایش /dev/disk/by-uuid.
 
-            if not related_devices:
-                # fallback به روش مستقیم
-                sys_disk_path = f"{self.SYS_BLOCK}/{disk}"
-                if os.path.exists(sys_disk_path):
-                    for entry in os.listdir(sys_disk_path):
-                        if entry != disk and entry.startswith(disk):
-                            if self._is_valid_device_name(entry) or entry.startswith(disk):
-                                related_devices.add(f"/dev/{entry}")
+        اگر یک دستگاه چند UUID داشته باشد، اولی به ترتیب نام نگه داشته می‌شود.
 
-            if not related_devices:
-                return None
-
-            # بررسی UUIDها
-            for uuid_name in sorted(os.listdir(uuid_dir)):
-                uuid_path = os.path.join(uuid_dir, uuid_name)
-                try:
-                    resolved = os.path.realpath(uuid_path)
-                    if resolved in related_devices:
-                        return uuid_name
-                except (OSError, IOError):
-                    continue
-        except (OSError, IOError, ValueError):
+        Returns:
+            Dict[str, str]: نگاشت نام دستگاه (مثل 'sda1') به UUID.
+        """
+        index: Dict[str, str] = {}
+        try:
+            with os.scandir("/dev/disk/by-uuid") as it:
+                for entry in it:
+                    if not entry.is_symlink():
+                        continue
+                    try:
+                        dev_name = os.path.basename(os.readlink(entry.path))
+                    except (OSError, IOError):
+                        continue
+                    if dev_name not in index or entry.name < index[dev_name]:
+                        index[dev_name] = entry.name
+        except (OSError, IOError):
             pass
-        return None
+        return index
 
     def get_wwn_by_entry(self, entry: str) -> str:
         """دریافت WWN یا شناسه منحصر به فرد برای یک دیسک یا پارتیشن.
@@ -434,34 +965,73 @@ class DiskManager:
         Returns:
             str: شناسه منحصربه‌فرد یا رشته خالی.
         """
-        by_id_path = "/dev/disk/by-id"
-        if not os.path.exists(by_id_path):
-            return ""
+        return self._cached("wwn", entry, self._find_wwn_by_entry)
 
+    def _find_wwn_by_entry(self, entry: str) -> str:
+        """بدنه get_wwn_by_entry؛ نتیجه توسط _cached برای هر نام نگه داشته می‌شود.
+
+        پیمایش تکی /dev/disk/by-id با خروج زودهنگام به محض یافتن wwn-* منطبق؛ درون یک دور
+        get_disk_info به جای آن از نگاشت by-id همان دور استفاده می‌شود.
+        """
+        best_name, best_rank = "", 3
         try:
-            target_real_path = os.path.realpath(f"/dev/{entry}")
-            all_links = glob.glob(os.path.join(by_id_path, "*"))
-
-            wwn_candidate = None
-            nvme_candidate = None
-
-            for link in all_links:
-                try:
-                    link_real = os.path.realpath(link)
-                    if link_real == target_real_path:
-                        basename = os.path.basename(link)
-                        if basename.startswith("wwn-"):
-                            return basename
-                        if basename.startswith("nvme-nvme."):
-                            nvme_candidate = basename
-                        elif basename.startswith("nvme-") and nvme_candidate is None:
-                            nvme_candidate = basename
-                except (OSError, IOError):
-                    continue
+            with os.scandir("/dev/disk/by-id") as it:
+                for link in it:
+                    rank = self._by_id_rank(link.name)
+                    if rank is None or rank >= best_rank or not link.is_symlink():
+                        continue
+                    try:
+                        if os.path.basename(os.readlink(link.path)) != entry:
+                            continue
+                    except (OSError, IOError):
+                        continue
+                    if rank == 0:
+                        return link.name
+                    best_name, best_rank = link.name, rank
+        except (OSError, IOError):
+            pass
+        return best_name
+
+    @staticmethod
+    def _by_id_rank(basename: str) -> Optional[int]:
+        """اولویت یک نام by-id (عدد کمتر بهتر): wwn-* سپس nvme-nvme.* و در آخر nvme-*؛ بقیه None."""
+        if basename.startswith("wwn-"):
+            return 0
+        if basename.startswith("nvme-nvme."):
+            return 1
+        if basename.startswith("nvme-"):
+            return 2
+        return None
+
+    def _build_by_id_index(self) -> Dict[str, str]:
+        """ساخت نگاشت معکوس «نام دستگاه → نام by-id» با یک بار پیمایش /dev/disk/by-id.
 
-            return nvme_candidate or ""
+        لینک‌های udev مستقیماً به '../../{name}' اشاره می‌کنند، پس یک readlink و basename
+        جای realpath کامل را می‌گیرد. اولویت نام‌ها: ابتدا wwn-*، سپس nvme-nvme.* و در آخر nvme-*.
+
+        Returns:
+            Dict[str, str]: نگاشت نام دستگاه (مثل 'sda1') به شناسه by-id.
+        """
+        by_id_path = "/dev/disk/by-id"
+        index: Dict[str, str] = {}
+        ranks: Dict[str, int] = {}
+        try:
+            with os.scandir(by_id_path) as it:
+                for link in it:
+                    basename = link.name
+                    rank = self._by_id_rank(basename)
+                    if rank is None or not link.is_symlink():
+                        continue
+                    try:
+                        dev_name = os.path.basename(os.readlink(link.path))
+                    except (OSError, IOError):
+                        continue
+                    if rank < ranks.get(dev_name, 3):
+                        ranks[dev_name] = rank
+                        index[dev_name] = basename
         except (OSError, IOError):
-            return ""
+            pass
+        return index
 
     def get_disk_name_by_wwn(self, wwn: str) -> str:
         """دریافت نام دیسک یا پارتیشن بر اساس WWN یا شناسه منحصر به فرد.
@@ -472,21 +1042,15 @@ class DiskManager:
         Returns:
             str: نام دیسک یا پارتیشن (مثل 'sda', 'sda1', 'nvme0n1') یا رشته خالی در صورت عدم یافت.
         """
-        by_id_path = "/dev/disk/by-id"
-        if not os.path.exists(by_id_path):
-            return ""
-
-        wwn_path = os.path.join(by_id_path, wwn)
-        if not os.path.exists(wwn_path):
-            return ""
-
+        wwn_path = f"/dev/disk/by-id/{wwn}"
         try:
-            real_path = os.path.realpath(wwn_path)
-            if real_path.startswith("/dev/"):
-                return os.path.basename(real_path)
-            return ""
-        except (OSError, IOError):
+            # یک readlink به جای realpath؛ نبودن لینک همان OSError است
+            real_path = os.path.normpath(f"/dev/disk/by-id/{os.readlink(wwn_path)}")
+        except (OSError, IOError, ValueError):
             return ""
+        if real_path.startswith("/dev/"):
+            return os.path.basename(real_path)
+        return ""
 
     def get_disk_name_from_partition(self,partition_name: str) -> str:
         """
@@ -499,15 +1063,16 @@ class DiskManager:
             str: نام دیسک والد (مثل 'sda' یا 'nvme0n1').
         """
         # برای دیسک‌های NVMe: جدا کردن تا آخرین 'p' که مربوط به پارتیشن است
-        nvme_match = re.match(r'^([a-zA-Z0-9]+n[0-9]+)p[0-9]+$', partition_name)
-        if nvme_match:
-            return nvme_match.group(1)
+        head, sep, tail = partition_name.rpartition("p")
+        if sep and tail.isdigit():
+            prefix, n_sep, namespace = head.rpartition("n")
+            if n_sep and prefix.isascii() and prefix.isalnum() and namespace.isdigit():
+                return head
 
         # برای دیسک‌های قدیمی مثل sda, hdb, etc.
         # جدا کردن بخش عددی انتهایی (پارتیشن) از حروف
-        legacy_match = re.match(r'^([a-zA-Z]+)(?:[0-9]+)?$', partition_name)
-        if legacy_match:
-            base = legacy_match.group(1)
+        base = partition_name.rstrip("0123456789")
+        if base.isascii() and base.isalpha():
             # اگر اسم ورودی فقط حروف باشد (مثل 'sda')، خودش دیسک است
             # اگر عدد داشت (مثل 'sda1')، باز هم base همان 'sda' است
             return base
@@ -522,17 +1087,60 @@ class DiskManager:
         Returns:
             Optional[str]: نام دیسک سیستم‌عامل (مثل 'sda') یا None در صورت شکست.
         """
+        for dev_name in self._mount_table().root_devs:  # مثال: 'sda2'
+            disk = self._parent_block_entry(dev_name)
+            if disk:
+                return disk
+        return None
+
+    def _read_proc_mounts(self) -> bytes:
+        """خواندن کل /proc/mounts با os.read و بافر ۶۴ کیلوبایتی.
+
+        در عمل کل جدول با یک read برمی‌گردد؛ چون procfs ممکن است کمتر از بافر برگرداند،
+        تا رسیدن به EOF ادامه داده می‌شود. تحلیل روی bytes انجام می‌شود تا فقط فیلدهای
+        موردنیاز decode شوند.
+
+        Returns:
+            bytes: محتوای فایل یا بایت خالی در صورت خطا.
+        """
         try:
-            with open(self.PROC_MOUNTS, 'r') as f:
-                for line in f:
-                    parts = line.split()
-                    if len(parts) >= 3 and parts[1] == '/' and parts[0].startswith('/dev/'):
-                        dev_name = os.path.basename(parts[0])  # مثال: 'sda2'
-                        for disk in os.listdir(self.SYS_BLOCK):
-                            if dev_name.startswith(disk):
-                                return disk
-        except (OSError, IOError, ValueError):
-            pass
+            fd = os.open(self.PROC_MOUNTS, os.O_RDONLY | os.O_CLOEXEC)
+        except (OSError, IOError):
+            return b""
+        chunks: List[bytes] = []
+        try:
+            while True:
+                chunk = os.read(fd, self._MOUNTS_READ_SIZE)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        except (OSError, IOError):
+            return b""
+        finally:
+            os.close(fd)
+        return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+    def _parent_block_entry(self, dev_name: str) -> Optional[str]:
+        """یافتن ورودی /sys/block متناظر با یک دستگاه یا پارتیشن با حذف پسوند پارتیشن.
+
+        مثال: 'sda2' → 'sda'، 'nvme0n1p2' → 'nvme0n1'، 'vda' → 'vda'. برخلاف تطبیق پیشوندی،
+        'sdaa1' هرگز به 'sda' نسبت داده نمی‌شود.
+
+        Args:
+            dev_name (str): نام دستگاه بدون مسیر.
+
+        Returns:
+            Optional[str]: نام ورودی /sys/block یا None اگر پیدا نشود.
+        """
+        entries = self._sys_block_names
+        if dev_name in entries:
+            return dev_name
+        base = dev_name.rstrip("0123456789")
+        if base in entries:
+            return base
+        # پارتیشن‌های nvme/mmc با 'p' از شماره جدا می‌شوند (nvme0n1p2)
+        if base.endswith("p") and base[:-1] in entries:
+            return base[:-1]
         return None
 
     def get_partition_mount_info(self, partition_name: str) -> Optional[Dict[str, Any]]:
@@ -544,65 +1152,101 @@ class DiskManager:
         Returns:
             Optional[Dict[str, Any]]: اطلاعات پارتیشن یا None اگر mount نشده باشد.
         """
-        device_path = f"/dev/{partition_name}"
-        try:
-            with open(self.PROC_MOUNTS, 'r') as f:
-                for line in f:
-                    parts = line.split()
-                    if len(parts) < 6:
-                        continue
-                    if parts[0] == device_path:
-                        return {
-                            "device": parts[0],
-                            "mount_point": parts[1],
-                            "filesystem": parts[2],
-                            "options": parts[3].split(','),
-                            "dump": int(parts[4]),
-                            "fsck": int(parts[5]),
-                        }
-        except (OSError, IOError, ValueError):
-            pass
-        return None
+        return self._reload_mounts().by_dev.get(f"/dev/{partition_name}")
+
+    def _reload_mounts(self) -> _MountTable:
+        """خواندن دوباره /proc/mounts و جایگزینی یکجای جدول نمونه.
+
+        هر دور get_disk_info/get_disks_info_all و هر پرس‌وجوی مستقل mount یک بار این را صدا
+        می‌زند تا mount/umount‌های اخیر روی نمونه بلندمدت (instance()) هم دیده شوند.
+        """
+        mounts = self._mounts = self._parse_mounts()
+        return mounts
 
-    def get_mounted_disk_size_usage(self, disk: str) -> Dict[str, Optional[float]]:
+    def _mount_table(self) -> _MountTable:
+        """آخرین جدول mountهای خوانده‌شده (برای os_disk)؛ در صورت نبود، یک بار ساخته می‌شود."""
+        # خواندن یک‌باره در متغیر محلی تا پاک شدن هم‌زمان self._mounts در thread دیگر None برنگرداند
+        mounts = self._mounts
+        if mounts is None:
+            mounts = self._mounts = self._parse_mounts()
+        return mounts
+
+    def _parse_mounts(self) -> _MountTable:
+        """تحلیل کامل /proc/mounts در یک گذر و ساخت تمام نگاشت‌های موردنیاز.
+
+        Returns:
+            _MountTable: جدول mountهای دستگاه‌های /dev.
+        """
+        table = _MountTable()
+        seen_devs: Set[str] = set()
+        for line in self._read_proc_mounts().splitlines():
+            # اکثر خطوط (tmpfs، overlay، cgroup و ...) بدون split و decode همین‌جا رد می‌شوند
+            if not line.startswith(b'/dev/'):
+                continue
+            parts = line.split()
+            if len(parts) < 3:
+                continue
+            device = os.fsdecode(parts[0])
+            mount_point = os.fsdecode(parts[1])
+            dev_name = device[5:]
+            if mount_point == "/":
+                table.root_devs.append(dev_name)
+
+            # فقط mount پارتیشن‌ها (نه خود دیسک) در فضای مصرفی دیسک حساب می‌شود
+            disk = self._parent_block_entry(dev_name)
+            if disk is not None and disk != dev_name:
+                table.points_by_disk.setdefault(disk, []).append(mount_point)
+                if dev_name not in seen_devs:
+                    seen_devs.add(dev_name)
+                    table.unique_points_by_disk.setdefault(disk, []).append(mount_point)
+
+            if device in table.by_dev or len(parts) < 6:
+                continue
+            try:
+                dump, fsck = int(parts[4]), int(parts[5])
+            except ValueError:
+                continue
+            table.by_dev[device] = {
+                "device": device,
+                "mount_point": mount_point,
+                "filesystem": os.fsdecode(parts[2]),
+                "options": os.fsdecode(parts[3]).split(','),
+                "dump": dump,
+                "fsck": fsck,
+            }
+        return table
+
+    def get_mounted_disk_size_usage(self, disk: str, dedupe: bool = True) -> Dict[str, Optional[float]]:
         """محاسبه حجم کل، مصرفی، آزاد و درصد استفاده برای دیسک.
 
         Args:
             disk (str): نام دیسک (مثل 'sda', 'nvme0n1', 'mmcblk0').
+            dedupe (bool): اگر True باشد هر پارتیشن فقط یک بار شمرده می‌شود (mountهای bind
+                همان پارتیشن نادیده گرفته می‌شوند)؛ False رفتار قدیمی جمع همه نقاط mount است.
 
         Returns:
             Dict[str, Optional[float]]: دیکشنری شامل اطلاعات فضا.
         """
-        # تعیین الگوی پارتیشن بر اساس نوع دیسک
-        if disk.startswith(("nvme", "mmcblk")):
-            partition_pattern = re.compile(rf"^{re.escape(disk)}p\d+$")
-        else:
-            partition_pattern = re.compile(rf"^{re.escape(disk)}\d+$")
+        def load() -> Dict[str, Optional[float]]:
+            table = self._reload_mounts()
+            points = tuple((table.unique_points_by_disk if dedupe else table.points_by_disk).get(disk, ()))
+            return self._usage_of(points)
 
-        # یافتن نقاط mount
-        mount_points: List[str] = []
-        try:
-            with open(self.PROC_MOUNTS, 'r') as f:
-                for line in f:
-                    parts = line.split()
-                    if len(parts) < 3 or not parts[0].startswith('/dev/'):
-                        continue
-                    dev_name = os.path.basename(parts[0])
-                    if partition_pattern.match(dev_name):
-                        mount_points.append(parts[1])
-        except (OSError, IOError):
-            pass
+        return dict(self._ttl_cached(self._usage_cache, (disk, dedupe), self._usage_ttl_s, load))
 
-        # محاسبه آمار فضا
+    @staticmethod
+    def _usage_of(mount_points: Tuple[str, ...]) -> Dict[str, Optional[float]]:
+        """جمع آمار statvfs نقاط mount داده‌شده به شکل خروجی get_mounted_disk_size_usage."""
         total = used = free = 0
         for mp in mount_points:
             try:
-                stat = os.statvfs(mp)
-                total += stat.f_frsize * stat.f_blocks
-                free += stat.f_frsize * stat.f_bavail
-                used += stat.f_frsize * (stat.f_blocks - stat.f_bfree)
+                # statvfs_result یک tuple است: (f_bsize, f_frsize, f_blocks, f_bfree, f_bavail, ...)
+                _, frsize, blocks, bfree, bavail = os.statvfs(mp)[:5]
             except (OSError, IOError):
                 continue
+            total += frsize * blocks
+            free += frsize * bavail
+            used += frsize * (blocks - bfree)
 
         usage_percent = round(used / total * 100, 2) if total > 0 else 0.0
         return {
@@ -615,111 +1259,173 @@ class DiskManager:
     def get_temperature(self, disk: str) -> Optional[int]:
         """دریافت دمای دیسک از منابع مختلف سیستم.
 
+        دما در مقیاس دقیقه تغییر می‌کند؛ نتیجه هر دیسک به مدت temp_ttl_s ثانیه (پارامتر سازنده)
+        نگه داشته می‌شود تا حلقه‌های پایش هر بار sysfs یا smartctl را اجرا نکنند.
+
         Returns:
             Optional[int]: دمای دیسک به سانتی‌گراد یا None.
         """
-        # روش ۱: hwmon
-        temp = self._get_temperature_from_hwmon(disk)
-        if temp is not None:
-            return temp
+        return self._ttl_cached(self._temp_cache, disk, self._temp_ttl_s, lambda: self._probe_temperature(disk))
 
-        # روش ۲: فایل temp مستقیم
-        temp = self._get_temperature_from_device(disk)
-        if temp is not None:
-            return temp
+    def _probe_temperature(self, disk: str) -> Optional[int]:
+        """خواندن دمای دیسک از منابع به ترتیب اولویت (بدنه get_temperature).
 
-        # روش ۳: scsi enterprise
-        temp = self._get_temperature_from_scsi(disk)
-        if temp is not None:
-            return temp
+        منبع sysfs موفق برای هر دیسک به خاطر سپرده می‌شود تا فراخوانی‌های بعدی مستقیماً همان
+        فایل را بخوانند؛ اگر آن منبع دیگر مقداری نداشت، همه منابع دوباره به ترتیب امتحان می‌شوند.
+
+        Returns:
+            Optional[int]: دمای دیسک به سانتی‌گراد یا None.
+        """
+        source = self._temp_source.get(disk)
+        if source is not None:
+            temp = source(disk)
+            if temp is not None:
+                return temp
+            self._temp_source.pop(disk, None)
+
+        # روش ۱: hwmon، روش ۲: فایل temp مستقیم، روش ۳: scsi enterprise
+        for source in (self._get_temperature_from_hwmon,
+                       self._get_temperature_from_device,
+                       self._get_temperature_from_scsi):
+            temp = source(disk)
+            if temp is not None:
+                self._temp_source[disk] = source
+                return temp
 
         # روش ۴: smartctl (آخرین راه‌حل)
         return self._get_temperature_from_smartctl(disk)
 
     def _get_temperature_from_hwmon(self, disk: str) -> Optional[int]:
-        """خواندن دما از hwmon با تطبیق مسیر دستگاه واقعی."""
-        if not os.path.exists(self.SYS_CLASS_HWMON):
-            return None
+        """خواندن دما از hwmon با تطبیق مسیر دستگاه واقعی (از روی نگاشت یک‌باره hwmon)."""
+        for temp_path in self._hwmon_paths_of(disk):
+            temp = _read_small_int(temp_path)
+            if temp is not None:
+                return temp // 1000
+        return None
+
+    def _hwmon_paths_of(self, disk: str) -> Tuple[str, ...]:
+        """مسیر فایل‌های temp1_input حسگر hwmon یک دیسک، کش‌شده برای هر دیسک.
 
+        نتیجه مثبت تا refresh() یا invalidate_cache() نگه داشته می‌شود تا هر بار خواندن دما
+        فقط یک read باشد. نتیجه منفی (دیسک بدون hwmon) پس از HWMON_NEGATIVE_TTL ثانیه دوباره
+        بررسی می‌شود، چون درایور حسگر (مثل drivetemp) ممکن است بعداً بارگذاری شود.
+
+        Args:
+            disk (str): نام دیسک.
+
+        Returns:
+            Tuple[str, ...]: مسیر فایل‌های دما (ممکن است خالی باشد).
+        """
+        now = time.monotonic()
+        hit = self._hwmon_by_disk.get(disk)
+        if hit is not None and (hit[0] or now < hit[1]):
+            return hit[0]
+        # پس از انقضای نتیجه منفی، نگاشت hwmon اگر قدیمی‌تر از TTL باشد دوباره ساخته می‌شود
+        temp_map = self._hwmon_map(max_age=None if hit is None else self.HWMON_NEGATIVE_TTL)
+        paths = tuple(temp_map.get(self._disk_device_path(disk), ()))
+        self._hwmon_by_disk[disk] = (paths, now + self.HWMON_NEGATIVE_TTL)
+        return paths
+
+    def _hwmon_map(self, max_age: Optional[float] = None) -> Dict[str, List[str]]:
+        """نگاشت مسیر واقعی دستگاه به فایل‌های temp1_input حسگرهای hwmon آن.
+
+        /sys/class/hwmon فقط یک بار (در اولین نیاز) پیمایش می‌شود و نتیجه تا refresh()
+        یا invalidate_cache() نگه داشته می‌شود.
+
+        Args:
+            max_age (Optional[float]): اگر داده شود و نگاشت قدیمی‌تر از این (ثانیه) باشد،
+                دوباره ساخته می‌شود.
+
+        Returns:
+            Dict[str, List[str]]: نگاشت مسیر دستگاه به مسیر فایل‌های دما به ترتیب پیمایش.
+        """
+        if self._hwmon_temp_paths is not None and (
+                max_age is None or time.monotonic() - self._hwmon_scanned_at < max_age):
+            return self._hwmon_temp_paths
+
+        temp_paths: Dict[str, List[str]] = {}
         try:
-            disk_device_path = os.path.realpath(f"{self.SYS_BLOCK}/{disk}/device")
-            for hwmon_dir in os.listdir(self.SYS_CLASS_HWMON):
-                hwmon_path = os.path.join(self.SYS_CLASS_HWMON, hwmon_dir)
-                device_link = os.path.join(hwmon_path, "device")
-                if os.path.islink(device_link):
-                    hwmon_device_path = os.path.realpath(device_link)
-                    if hwmon_device_path == disk_device_path:
-                        temp_path = os.path.join(hwmon_path, "temp1_input")
-                        if os.path.exists(temp_path):
-                            temp_raw = FileManager.read_strip(temp_path)
-                            if temp_raw.lstrip('-').isdigit():
-                                return int(temp_raw) // 1000
-        except (OSError, ValueError, IOError):
+            with os.scandir(self.SYS_CLASS_HWMON) as it:
+                for entry in it:
+                    # ورودی‌های /sys/class/hwmon همگی symlink هستند؛ بقیه نادیده گرفته می‌شوند
+                    if not entry.is_symlink():
+                        continue
+                    hwmon_path = self._sys_realpath(entry.path)
+                    try:
+                        link_target = os.readlink(f"{hwmon_path}/device")
+                    except OSError:
+                        # hwmon بدون دستگاه (مثل coretemp)
+                        continue
+                    device_path = os.path.normpath(f"{hwmon_path}/{link_target}")
+                    temp_paths.setdefault(device_path, []).append(f"{entry.path}/temp1_input")
+        except (OSError, IOError):
             pass
-        return None
+        self._hwmon_temp_paths = temp_paths
+        self._hwmon_scanned_at = time.monotonic()
+        return temp_paths
 
     def _get_temperature_from_device(self, disk: str) -> Optional[int]:
         """خواندن دما مستقیماً از /sys/block/{disk}/device/temp."""
-        temp_path = f"{self.SYS_BLOCK}/{disk}/device/temp"
-        try:
-            if os.path.exists(temp_path):
-                temp_str = FileManager.read_strip(temp_path)
-                if temp_str.lstrip('-').isdigit():
-                    temp = int(temp_str)
-                    return temp // 1000 if temp > 1000 else temp
-        except (OSError, ValueError, IOError):
-            pass
+        temp = self._safe_read_int(disk, "device/temp")
+        if temp is not None:
+            return temp // 1000 if temp > 1000 else temp
         return None
 
     def _get_temperature_from_scsi(self, disk: str) -> Optional[int]:
-        """خواندن دما از scsi_disk برای دیسک‌های SCSI/SATA."""
-        if not os.path.exists(self.SYS_SCSI_DISK):
-            return None
+        """خواندن دما از ویژگی temperature دستگاه SCSI/SATA.
 
-        try:
-            for scsi_entry in os.listdir(self.SYS_SCSI_DISK):
-                device_path = os.path.join(self.SYS_SCSI_DISK, scsi_entry, "device")
-                block_link = os.path.join(device_path, "block")
-                if os.path.exists(block_link):
-                    try:
-                        resolved = os.readlink(block_link)
-                        if resolved == disk:
-                            temp_path = os.path.join(device_path, "temperature")
-                            if os.path.exists(temp_path):
-                                temp_str = FileManager.read_strip(temp_path)
-                                if temp_str.isdigit():
-                                    return int(temp_str)
-                    except (OSError, ValueError):
-                        continue
-        except (OSError, IOError):
-            pass
+        /sys/block/{disk}/device همان پوشه دستگاه SCSI است که /sys/class/scsi_disk/*/device
+        به آن اشاره می‌کند؛ پس به‌جای پیمایش همه ورودی‌های scsi_disk، فایل دما مستقیماً با یک
+        open خوانده می‌شود (برای دیسک‌های غیر SCSI این فایل وجود ندارد).
+        """
+        temp_str = self._safe_read(disk, "device/temperature")
+        if temp_str.isdigit():
+            return int(temp_str)
         return None
 
     def _get_temperature_from_smartctl(self, disk: str) -> Optional[int]:
-        """دریافت دمای هارد از طریق دستور smartctl برای IDهای 190 و 194."""
+        """دریافت دمای هارد از smartctl با نگهداری نتیجه به مدت SMARTCTL_TTL ثانیه.
+
+        اجرای smartctl (و sudo) برای هر فراخوانی یک fork/exec کامل است؛ در حلقه‌های پایش،
+        نتیجه (حتی None برای دیسک‌هایی که smartctl دما گزارش نمی‌کند) تا پایان TTL استفاده می‌شود.
+        """
+        if not self._smartctl_available():
+            return None
+        return self._ttl_cached(self._smart_temps, disk, self.SMARTCTL_TTL,
+                                lambda: self._read_smartctl_temperature(disk))
+
+    def _smartctl_available(self) -> bool:
+        """بررسی یک‌باره (تا refresh بعدی) وجود smartctl تا بدون آن هیچ پردازه‌ای اجرا نشود."""
+        if self._smartctl_ok is None:
+            self._smartctl_ok = os.access(self.SMARTCTL_PATH, os.X_OK)
+        return self._smartctl_ok
+
+    def _read_smartctl_temperature(self, disk: str) -> Optional[int]:
+        """اجرای smartctl و استخراج دما از ویژگی‌های 190 و 194."""
         try:
             device_path = f"/dev/{disk}"
-            result = subprocess.run(
-                ["/usr/bin/sudo", "/usr/sbin/smartctl", "-A", device_path],
-                capture_output=True,
-                text=True,
-                timeout=5,
-                check=False
-            )
-
-            if result.returncode != 0 or not result.stdout:
+            cmd = [self.SMARTCTL_PATH, "-A", device_path]
+            if self._use_sudo:
+                cmd = ["/usr/bin/sudo"] + cmd
+            # اجرای مستقیم و بی‌صدا (run_cli_command هر دستور را روی stdout چاپ می‌کند)
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5, check=False)
+
+            # کد خروجی smartctl یک bitmask است؛ فقط بیت‌های 0 (خطای خط فرمان) و 1 (باز نشدن دستگاه)
+            # یعنی خروجی معتبری در کار نیست و بیت‌های بالاتر هشدارهای وضعیت دیسک‌اند که جدول را هم چاپ می‌کنند
+            if result.returncode < 0 or result.returncode & 0x03 or not result.stdout:
                 return None
 
             for line in result.stdout.splitlines():
-                if re.match(r"^\s*(190|194)\s", line):
-                    parts = line.split()
-                    if len(parts) >= 10:
-                        raw_value = parts[9]
-                        match = re.match(r'^(\d+)', raw_value)
-                        if match:
-                            temp = int(match.group(1))
-                            if 0 <= temp <= 100:
-                                return temp
+                # فیلتر سریع رشته‌ای پیش از هر پردازش دیگر؛ اکثر خطوط اینجا رد می‌شوند
+                if not line.lstrip().startswith(_SMART_TEMP_PREFIXES):
+                    continue
+                parts = line.split()
+                if len(parts) >= 10:
+                    match = _SMART_ID_RE.match(parts[9])
+                    if match:
+                        temp = int(match.group(1))
+                        if 0 <= temp <= 100:
+                            return temp
         except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError, ValueError):
             pass
         return None
@@ -733,21 +1439,31 @@ class DiskManager:
         Returns:
             Dict[str, Any]: دیکشنری کامل اطلاعات دیسک و پارتیشن‌ها.
         """
-        has_partition = self.has_partitions(disk)
+        return self._collect_disk_info(_PassCache(self), disk)
+
+    def _collect_disk_info(self, cache: _PassCache, disk: str) -> Dict[str, Any]:
+        """بدنه get_disk_info با کش دور داده‌شده."""
+        ctx = self._collect_disk_context(cache, disk)
+        partition_names = ctx.partitions
+        has_partition = bool(partition_names)
+        static_attrs = self._static_attrs(disk)
+        # پیشوند مسیر sysfs دیسک یک بار ساخته و برای همه خواندن‌های این دور استفاده می‌شود
+        base = f"{self.SYS_BLOCK}/{disk}/"
+        sectors = _read_small_int(base + "size")
         disk_info = {
             "disk": disk,
-            "model": self.get_model(disk),
-            "vendor": self.get_vendor(disk),
-            "state": self.get_stat(disk),
+            "model": static_attrs["model"],
+            "vendor": static_attrs["vendor"],
+            "state": _read_small(base + "device/state"),
             "device_path": self.get_path(disk),
-            "physical_block_size": self.get_physical_block_size(disk),
-            "logical_block_size": self.get_logical_block_size(disk),
-            "scheduler": self.get_scheduler(disk),
-            "wwid": self.get_wwid(disk),
-            "total_bytes": self.get_total_size(disk),
+            "physical_block_size": static_attrs["physical_block_size"],
+            "logical_block_size": static_attrs["logical_block_size"],
+            "scheduler": _read_small(base + "queue/scheduler"),
+            "wwid": static_attrs["wwid"],
+            "total_bytes": sectors * 512 if sectors is not None else None,
             "temperature_celsius": self.get_temperature(disk),
-            "wwn": self.get_wwn_by_entry(disk),
-            "uuid": self.get_uuid(disk),
+            "wwn": self._cached("wwn", disk, lambda entry: cache.by_id_by_name.get(entry, "")),
+            "uuid": ctx.uuid,
             "slot_number": self.get_slot_number(disk),
             "type": self.get_disk_type(disk),
             "has_partition": has_partition,
@@ -764,60 +1480,108 @@ class DiskManager:
             return disk_info
 
         # اگر پارتیشن داشت
-        usage = self.get_mounted_disk_size_usage(disk)
+        usage = self._ttl_cached(self._usage_cache, (disk, True), self._usage_ttl_s,
+                                 lambda: self._usage_of(ctx.mount_points))
         disk_info.update({
             "used_bytes": usage["used_bytes"],
             "free_bytes": usage["free_bytes"],
             "usage_percent": usage["usage_percent"],
         })
 
-        # جمع‌آوری اطلاعات پارتیشن‌ها
+        # جمع‌آوری اطلاعات پارتیشن‌ها: حجم‌ها به صورت دسته‌ای و mount/wwn از کش همین دور
         partitions_info = []
-        sys_disk_path = f"{self.SYS_BLOCK}/{disk}"
-
-        try:
-            for entry in os.listdir(sys_disk_path):
-                if entry == disk:
-                    continue
-                if (disk.startswith(("nvme", "mmcblk")) and entry.startswith(disk) and len(entry) > len(disk)) or \
-                   (not disk.startswith(("nvme", "mmcblk")) and entry.startswith(disk)):
-
-                    partition_name = entry
-                    partition_path = f"/dev/{partition_name}"
-                    size_bytes = self.get_total_size(partition_name)
-                    info_partition = self.get_partition_mount_info(partition_name)
-
-                    # استخراج اطلاعات با مدیریت None
-                    mount_point = info_partition["mount_point"] if info_partition else None
-                    filesystem = info_partition["filesystem"] if info_partition else None
-                    options = info_partition["options"] if info_partition else None
-                    dump = info_partition["dump"] if info_partition else None
-                    fsck = info_partition["fsck"] if info_partition else None
-
-                    partitions_info.append({
-                        "name": partition_name,
-                        "path": partition_path,
-                        "size_bytes": size_bytes,
-                        "wwn": self.get_wwn_by_entry(partition_name),
-                        "mount_point": mount_point,
-                        "filesystem": filesystem,
-                        "options": options,
-                        "dump": dump,
-                        "fsck": fsck,
-                    })
-        except (OSError, IOError):
-            pass
+        mounts = cache.mounts
+        part_sectors = [_read_small_int(base + name + "/size") for name in partition_names]
+        for partition_name, sectors in zip(partition_names, part_sectors):
+            partition_path = f"/dev/{partition_name}"
+            size_bytes = sectors * 512 if sectors is not None else None
+            info_partition = mounts.by_dev.get(partition_path)
+
+            # استخراج اطلاعات با مدیریت None
+            mount_point = info_partition["mount_point"] if info_partition else None
+            filesystem = info_partition["filesystem"] if info_partition else None
+            options = info_partition["options"] if info_partition else None
+            dump = info_partition["dump"] if info_partition else None
+            fsck = info_partition["fsck"] if info_partition else None
+
+            partitions_info.append({
+                "name": partition_name,
+                "path": partition_path,
+                "size_bytes": size_bytes,
+                "wwn": cache.by_id_by_name.get(partition_name, ""),
+                "mount_point": mount_point,
+                "filesystem": filesystem,
+                "options": options,
+                "dump": dump,
+                "fsck": fsck,
+            })
 
         disk_info["partitions"] = partitions_info
         return disk_info
 
-    def get_disks_info_all(self) -> List[Dict[str, Any]]:
+    def _collect_disk_context(self, cache: _PassCache, disk: str) -> _DiskCtx:
+        """ساخت زمینه یک دیسک (پارتیشن‌ها، نقاط mount و UUID) از کش‌های دور جاری.
+
+        Args:
+            cache (_PassCache): کش دور جاری.
+            disk (str): نام دیسک.
+
+        Returns:
+            _DiskCtx: زمینه دیسک.
+        """
+        # یک بار پیمایش /sys/block/{disk} هم وجود پارتیشن و هم لیست آن‌ها را مشخص می‌کند
+        partitions = self._scan_partitions(disk)
+        return _DiskCtx(
+            disk=disk,
+            partitions=tuple(partitions),
+            mount_points=tuple(cache.mounts.unique_points_by_disk.get(disk, ())) if partitions else (),
+            uuid=self._uuid_of(cache, disk, partitions),
+        )
+
+    def _static_attrs(self, disk: str) -> Dict[str, str]:
+        """ویژگی‌های ثابت sysfs یک دیسک (جدول _STATIC_ATTRS)، کش‌شده تا refresh() یا invalidate_cache()."""
+        return self._cached("sysfs_attrs", disk, self._read_static_attrs)
+
+    def _read_static_attrs(self, disk: str) -> Dict[str, str]:
+        """خواندن ویژگی‌های جدول _STATIC_ATTRS یک دیسک، هر دایرکتوری با یک scandir.
+
+        وضعیت (state) و scheduler قابل تغییر هستند و اینجا خوانده نمی‌شوند.
+        """
+        base = f"{self.SYS_BLOCK}/{disk}/"
+        attrs: Dict[str, str] = {}
+        for subdir, names in self._STATIC_ATTRS:
+            attrs.update(self._bulk_read(base + subdir, names))
+        return attrs
+
+    def get_disks_info_all(self, parallel: bool = True) -> List[Dict[str, Any]]:
         """جمع‌آوری اطلاعات تمام دیسک‌های سیستم.
 
+        خواندن‌های sysfs و فراخوانی smartctl هر دیسک مستقل از بقیه است، پس دیسک‌ها به‌صورت
+        هم‌زمان در یک ThreadPool پردازش می‌شوند (GIL هنگام I/O آزاد است). کش‌های مشترک دور
+        پیش از شروع threadها پر می‌شوند تا هر thread دوباره آن‌ها را نسازد. جدول mountها در
+        ابتدای هر فراخوانی یک بار از نو خوانده می‌شود تا mount/umount‌های اخیر دیده شوند.
+
+        Args:
+            parallel (bool): اگر False باشد دیسک‌ها به ترتیب در همین thread پردازش می‌شوند
+                (برای اشکال‌زدایی و trace خواناتر).
+
         Returns:
-            List[Dict[str, Any]]: لیستی از دیکشنری‌های اطلاعات دیسک.
+            List[Dict[str, Any]]: لیستی از دیکشنری‌های اطلاعات دیسک (به ترتیب self.disks).
         """
-        return [self.get_disk_info(disk) for disk in self.disks]
+        # یک بار خواندن /proc/mounts برای کل این دور (نه برای هر دیسک)؛ جدول جدید یکجا جایگزین می‌شود.
+        # این کار باید پیش از دسترسی به self.disks باشد تا محاسبه os_disk در نمونه تازه از همین
+        # جدول استفاده کند و فایل دوباره خوانده نشود
+        mounts = self._reload_mounts()
+        disks = self.disks
+        cache = _PassCache(self, mounts)
+        if not parallel or len(disks) <= 1:
+            return [self._collect_disk_info(cache, disk) for disk in disks]
+        # دسترسی به propertyها کش‌های تنبل را همین‌جا (در یک thread) پر می‌کند
+        cache.by_id_by_name
+        cache.uuid_by_name
+        self._hwmon_map()
+        with ThreadPoolExecutor(max_workers=min(self.MAX_INFO_WORKERS, len(disks))) as pool:
+            return list(pool.map(lambda disk: self._collect_disk_info(cache, disk), disks))
 
     def disk_wipe_signatures(self, device_path: str) -> bool:
         """پاک‌کردن تمام سیگنچرهای فایل‌سیستم و پارتیشن با wipefs.
@@ -845,7 +1609,10 @@ class DiskManager:
 
 
         cmd = ["/usr/sbin/wipefs", "-a", device_path]
-        std_out, std_error = run_cli_command(cmd, use_sudo=True)
+        std_out, std_error = run_cli_command(cmd, use_sudo=self._use_sudo)
+        # جدول پارتیشن پاک شده است؛ لیست پارتیشن‌ها و شناسه‌های کش‌شده این دیسک دیگر معتبر نیستند
+        self.invalidate_cache(device_name)
+        self.invalidate_shared(device_name)
         return True
 
     def disk_clear_zfs_label(self, device_path: str) -> bool:
@@ -877,32 +1644,19 @@ class DiskManager:
         if not self._is_block_device(device_name):
             return False
 
-        # پیدا کردن اولین پارتیشن
-        sys_disk_path = f"{self.SYS_BLOCK}/{device_name}"
-        partitions = []
-
-        try:
-            for entry in os.listdir(sys_disk_path):
-                if entry == device_name:
-                    continue
-                # بررسی اینکه آیا پارتیشن است (همان منطق کلاس شما در get_disk_info)
-                if (device_name.startswith(("nvme", "mmcblk")) and entry.startswith(device_name) and len(entry) > len(device_name)) or \
-                        (not device_name.startswith(("nvme", "mmcblk")) and entry.startswith(device_name)):
-                    partitions.append(entry)
-        except (OSError, IOError):
-            return False
+        # پیدا کردن اولین پارتیشن (همان منطق get_disk_info)
+        partitions = self._scan_partitions(device_name)
 
         # اگر پارتیشنی وجود نداشت، روی خود دیسک عمل کن (برای سازگاری)
         if not partitions:
             target_path = device_path
         else:
-            # مرتب‌سازی هوشمند برای پیدا کردن اولین پارتیشن (sda1 قبل از sda10)
-            partitions.sort(key=lambda x: [int(c) if c.isdigit() else c for c in re.split(r'(\d+)', x)])
+            # لیست پارتیشن‌ها از قبل به ترتیب طبیعی است (sda1 قبل از sda10)
             first_partition = partitions[0]
             target_path = f"/dev/{first_partition}"
 
         cmd = [ "/usr/bin/zpool", "labelclear", "-f", target_path]
-        std_out, std_error = run_cli_command(cmd, use_sudo=True)
+        std_out, std_error = run_cli_command(cmd, use_sudo=self._use_sudo)
         return True
 
     def get_partition_count(self, disk: str) -> int:
@@ -931,28 +1685,6 @@ class DiskManager:
         if not self._is_valid_device_name(disk) or not self._is_block_device(disk):
             return []
 
-        sys_disk_path = f"{self.SYS_BLOCK}/{disk}"
-        partition_names = []
-
-        try:
-            for entry in os.listdir(sys_disk_path):
-                if entry == disk:
-                    continue
-                # بررسی الگوی پارتیشن برای انواع مختلف دیسک
-                if disk.startswith(("nvme", "mmcblk")):
-                    # مثلاً nvme0n1 → nvme0n1p1, mmcblk0 → mmcblk0p1
-                    if entry.startswith(disk) and len(entry) > len(disk):
-                        # بررسی اینکه بعد از نام دیسک، یک 'p' و سپس عدد بیاید
-                        suffix = entry[len(disk):]
-                        if re.match(r'^p\d+$', suffix):
-                            partition_names.append(entry)
-                else:
-                    # مثلاً sda → sda1, sda10
-                    if entry.startswith(disk) and entry[len(disk):].isdigit():
-                        partition_names.append(entry)
-        except (OSError, IOError):
-            pass
-
-        # مرتب‌سازی هوشمند: sda1 قبل از sda10
-        partition_names.sort(key=lambda x: [int(c) if c.isdigit() else c for c in re.split(r'(\d+)', x)])
-        return partition_names
\ No newline at end of file
+        # مثلاً sda → sda1, sda10 و nvme0n1 → nvme0n1p1, mmcblk0 → mmcblk0p1
+        # لیست به ترتیب طبیعی برگردانده می‌شود: sda1 قبل از sda10
+        return self._scan_partitions(disk)
\ No newline at end of file
@@ -113,7 +113,7 @@ class DiskValidationMixin:
             return None, error_msg
 
         try:
-            obj_disk = DiskManager(contain_os_disk=contain_os_disk)
+            obj_disk = DiskManager.instance(contain_os_disk=contain_os_disk)
             if disk_name not in obj_disk.disks:
                 return None, f"دیسک '{disk_name}' یافت نشد."
             return obj_disk, None
@@ -20,7 +20,10 @@ class ZpoolManager:
     تمام مسیرهای دستگاه باید از نوع `/dev/disk/by-id/...` باشند.
     """
 
-    obj_disk = DiskManager()
+    @property
+    def obj_disk(self) -> DiskManager:
+        """نمونه مشترک DiskManager (پس از TOPOLOGY_TTL خودکار با نمونه تازه جایگزین می‌شود)."""
+        return DiskManager.instance()
 
     def __init__(self) -> None:
         """سازنده کلاس — ایجاد نمونه ZFS از libzfs."""
@@ -24,7 +24,7 @@ def db_update_disks(disks_info: List[Dict[str, Any]]) -> None:
         Exception: در صورت بروز خطا در تعامل با دیتابیس (توسط Django ORM).
 
     Example:
-        >>> manager = DiskManager()
+        >>> manager = DiskManager.instance()
         >>> all_disks = manager.get_disks_info_all()
         >>> db_update_disks(all_disks)
     """
@@ -78,7 +78,7 @@ def db_update_disk_single(disk_info: Dict[str, Any]) -> None:
         Exception: در صورت بروز خطا در تعامل با دیتابیس (توسط Django ORM).
 
     Example:
-        >>> manager = DiskManager()
+        >>> manager = DiskManager.instance()
         >>> disk_data = manager.get_disk_info('sda')
         >>> db_update_disk_single(disk_data)
     """
@@ -124,7 +124,7 @@ class DiskNameListView(APIView):
         save_to_db = get_request_param(request, "save_to_db", bool, False)
         request_data = dict(request.query_params)
         try:
-            obj_disk = DiskManager()
+            obj_disk = DiskManager.instance()
             return StandardResponse(request_data=request_data, save_to_db=save_to_db,
                                     data={"disk_names": obj_disk.disks},
                                     message="لیست نام دیسک‌ها با موفقیت دریافت شد.")
@@ -142,7 +142,7 @@ class DiskCountView(APIView):
         save_to_db = get_request_param(request, "save_to_db", bool, False)
         request_data = dict(request.query_params)
         try:
-            obj_disk = DiskManager()
+            obj_disk = DiskManager.instance()
             count = len(obj_disk.disks)
             return StandardResponse(request_data=request_data, save_to_db=save_to_db,
                                     data={"disk_count": count},
@@ -161,7 +161,7 @@ class OSdiskView(APIView):
         save_to_db = get_request_param(request, "save_to_db", bool, False)
         request_data = dict(request.query_params)
         try:
-            obj_disk = DiskManager()
+            obj_disk = DiskManager.instance()
             os_disk = obj_disk.os_disk
             return StandardResponse(request_data=request_data, save_to_db=save_to_db,
                                     data={"os_disk": os_disk},
@@ -183,7 +183,7 @@ class DiskView(DiskValidationMixin, APIView):
 
         if disk_name is None:
             try:
-                obj_disk = DiskManager(contain_os_disk=contain_os_disk)
+                obj_disk = DiskManager.instance(contain_os_disk=contain_os_disk)
                 disks_info = obj_disk.get_disks_info_all()
 
                 if save_to_db:
@@ -334,7 +334,7 @@ class PartitionIsMountedView(APIView):
                                          error_code="invalid_partition_name",
                                          error_message="نام پارتیشن معتبر نیست.", )
         try:
-            obj_disk = DiskManager()
+            obj_disk = DiskManager.instance()
             mount_info = obj_disk.get_partition_mount_info(partition_name)
             is_mounted = mount_info is not None
             return StandardResponse(request_data=request_data, save_to_db=save_to_db,
@@ -362,7 +362,7 @@ class PartitionTotalSizeView(APIView):
                                          error_code="invalid_partition_name",
                                          error_message="نام پارتیشن معتبر نیست.", )
         try:
-            obj_disk = DiskManager()
+            obj_disk = DiskManager.instance()
             total_size = obj_disk.get_total_size(partition_name)
             return StandardResponse(request_data=request_data, save_to_db=save_to_db,
                                     data={"partition": partition_name, "total_bytes": total_size},
@@ -172,13 +172,16 @@ class ZpoolCreateView(ZpoolValidationMixin, DiskValidationMixin, APIView):
         full_paths = [path for path, _ in validated_devices]
 
         for _, disk_name in validated_devices:
-            disk_manager = DiskManager()
+            disk_manager = DiskManager.instance()
             os_error = self.check_os_disk_protection(disk_manager, disk_name, save_to_db, request_data)
             if os_error:
                 return os_error
 
         try:
             std_out, std_error = zpool_manager_or_error.create_pool(pool_name, full_paths, vdev_valid)
+            # zpool روی دیسک‌ها پارتیشن می‌سازد؛ کش پارتیشن‌های نمونه مشترک DiskManager باطل می‌شود
+            for _, disk_name in validated_devices:
+                DiskManager.invalidate_shared(disk_name)
             return StandardResponse(message=f"Pool '{pool_name}' با موفقیت ایجاد شد.", status=201, request_data=request_data, save_to_db=save_to_db)
         except Exception as e:
             return build_standard_error_response(exc=e, request_data=request.data, save_to_db=save_to_db,
@@ -231,13 +234,14 @@ class ZpoolManageView(ZpoolValidationMixin, DiskValidationMixin, APIView):
                                                  error_message=err)
 
             _, disk_name = self._validate_and_extract_disk_info(new_device)
-            disk_manager = DiskManager()
+            disk_manager = DiskManager.instance()
             os_error = self.check_os_disk_protection(disk_manager, disk_name, save_to_db, request_data)
             if os_error:
                 return os_error
 
             try:
                 std_out, std_error = zpool_manager.replace_device(pool_name, old_device, new_device)
+                DiskManager.invalidate_shared(disk_name)
                 return StandardResponse(message="دیسک با موفقیت جایگزین شد.", request_data=request_data, save_to_db=save_to_db)
             except Exception as e:
                 return build_standard_error_response(exc=e, request_data=request.data, save_to_db=save_to_db,
@@ -257,13 +261,15 @@ class ZpoolManageView(ZpoolValidationMixin, DiskValidationMixin, APIView):
 
             full_paths = [p for p, _ in validated]
             for _, dn in validated:
-                dm = DiskManager()
+                dm = DiskManager.instance()
                 os_err = self.check_os_disk_protection(dm, dn, save_to_db, request_data)
                 if os_err:
                     return os_err
 
             try:
                 std_out, std_error = zpool_manager.add_vdev(pool_name, full_paths, vdev_ok)
+                for _, dn in validated:
+                    DiskManager.invalidate_shared(dn)
                 return StandardResponse(message="vdev با موفقیت اضافه شد.", request_data=request_data, save_to_db=save_to_db)
             except Exception as e:
                 return build_standard_error_response(exc=e, request_data=request.data, save_to_db=save_to_db,